@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("PySide6")
+
+from BlurViewer import BlurViewer, list_image_files  # noqa: E402
+
+
+def test_bare_filename_is_found_in_listing(tmp_path, monkeypatch):
+    for name in ("b.png", "a.jpg", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+    monkeypatch.chdir(tmp_path)
+
+    # Opening "a.jpg" from its own directory scans os.curdir
+    image_path = os.path.normpath("a.jpg")
+    directory = os.path.dirname(image_path) or os.curdir
+    files = list_image_files(directory, BlurViewer.SUPPORTED_EXTS)
+
+    assert files == ["a.jpg", "b.png"]
+    assert files.index(image_path) == 0
+
+
+def test_listing_keeps_directory_prefix(tmp_path):
+    (tmp_path / "a.jpg").write_bytes(b"")
+
+    files = list_image_files(str(tmp_path), BlurViewer.SUPPORTED_EXTS)
+
+    assert files == [os.path.normpath(str(tmp_path / "a.jpg"))]